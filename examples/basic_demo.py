@@ -22,7 +22,7 @@ def main():
     # Test single force calculation
     print("\n2. Calculating anti-gravity force at t=1.0s...")
     force = simulator.calculate_force(time=1.0)
-    print(f"   Force: {force} Newtons")
+    print(f"   Force: {force:.4f} Newtons")
     
     # Simulate trajectory
     print("\n3. Simulating 10-second trajectory...")
@@ -30,7 +30,7 @@ def main():
     
     # Show results
     print(f"   Final height after 10 seconds: {height_points[-1]:.2f} meters")
-    print(f"   Maximum height reached: {max(height_points):.2f} meters")
+    print(f"   Maximum height reached: {height_points.max():.2f} meters")
     
     # Optimize for higher levitation
     print("\n4. Optimizing field for 20-meter levitation...")
@@ -2,11 +2,75 @@
 Anti-Gravity Simulator - Core Physics Engine
 """
 
+import math
+
 import numpy as np
-from dataclasses import dataclass
-from typing import List, Tuple
+from dataclasses import dataclass, replace
+import multiprocessing
+
+from functools import lru_cache, partial
+from scipy.integrate import solve_ivp
+from scipy.optimize import least_squares
+from typing import Tuple
+
+@lru_cache(maxsize=16)
+def _time_grid(duration: float, steps: int) -> np.ndarray:
+    """Shared read-only time grid; identical grids are allocated once"""
+    grid = np.linspace(0.0, duration, steps)
+    grid.setflags(write=False)
+    return grid
+
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _integrate(duration, steps, mass, strength, frequency, stability):
+        """Euler-integrate the trajectory in compiled code"""
+        time_points = np.linspace(0.0, duration, steps)
+        height_points = np.empty(steps)
+        dt = duration / steps
+        mass_factor = strength * stability / (1 + 0.1 * mass)
+        omega = 2 * np.pi * frequency
+        velocity = 0.0
+        height = 0.0
+        for i in range(steps):
+            velocity += (mass_factor * np.sin(omega * time_points[i]) / mass) * dt
+            height += velocity * dt
+            height_points[i] = height
+        return time_points, height_points
+
+    @njit(cache=True, fastmath=True)
+    def _rhs_kernel(t, y, mass_factor, omega, mass):
+        """Compiled right-hand side of the levitation ODE"""
+        dy = np.empty(2)
+        dy[0] = y[1]
+        dy[1] = mass_factor * np.sin(omega * t) / mass
+        return dy
 
-@dataclass
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _integrate_batch(masses, strengths, duration, steps, frequency, stability):
+        """Integrate one trajectory per parameter set, one thread each"""
+        time_points = np.linspace(0.0, duration, steps)
+        height_points = np.empty((masses.size, steps))
+        dt = duration / steps
+        omega = 2 * np.pi * frequency
+        for i in prange(masses.size):
+            mass_factor = strengths[i] * stability / (1 + 0.1 * masses[i])
+            velocity = 0.0
+            height = 0.0
+            for k in range(steps):
+                velocity += (mass_factor * np.sin(omega * time_points[k]) / masses[i]) * dt
+                height += velocity * dt
+                height_points[i, k] = height
+        return time_points, height_points
+
+@dataclass(frozen=True, slots=True)
 class AntiGravityField:
     """Represents an anti-gravity field configuration"""
     strength: float = 0.8      # Field strength (0.0 to 1.0)
@@ -31,10 +95,37 @@ class AntiGravitySimulator:
         Args:
             mass: Mass of object in kilograms
         """
-        self.mass = mass
-        self.field = AntiGravityField()
+        self._mass = mass
+        self._field = AntiGravityField()
         self.time = 0.0
-        
+        self._recompute_cache()
+
+    @property
+    def mass(self) -> float:
+        """Mass of the levitated object in kilograms"""
+        return self._mass
+
+    @mass.setter
+    def mass(self, value: float):
+        self._mass = value
+        self._recompute_cache()
+
+    @property
+    def field(self) -> AntiGravityField:
+        """Current anti-gravity field configuration"""
+        return self._field
+
+    @field.setter
+    def field(self, value: AntiGravityField):
+        self._field = value
+        self._recompute_cache()
+
+    def _recompute_cache(self):
+        """Refresh constants derived from the field and mass"""
+        self._omega = 2 * math.pi * self._field.frequency
+        self._mass_factor = (self._field.strength * self._field.stability /
+                             (1 + 0.1 * self._mass))
+
     def calculate_force(self, time: float = None) -> float:
         """
         Calculate anti-gravity force at given time
@@ -49,60 +140,206 @@ class AntiGravitySimulator:
             time = self.time
             self.time += 0.1  # Auto-increment for animation
         
-        # Core physics equation: F = strength * sin(2π * frequency * time) * stability
-        force = (self.field.strength * 
-                np.sin(2 * np.pi * self.field.frequency * time) * 
-                self.field.stability)
-        
-        # Adjust for mass (heavier objects need more force)
-        adjusted_force = force * (1 / (1 + 0.1 * self.mass))
-        
-        return round(adjusted_force, 4)
+        # Core physics equation: F = strength * sin(2π * frequency * time) * stability,
+        # adjusted for mass (heavier objects need more force). The constant
+        # factors are cached so the scalar path stays on C-level math.sin.
+        # Rounding is left to display code; the kernel stays pure numeric.
+        return self._mass_factor * math.sin(self._omega * time)
+
+    def _force_array(self, time_points: np.ndarray,
+                     dtype=np.float64) -> np.ndarray:
+        """
+        Evaluate the force equation on a whole array of time values
+
+        Pass dtype=np.float32 for display-only consumers: half the memory
+        traffic and twice the SIMD width, at precision screens cannot
+        resolve anyway. The physics paths keep the float64 default.
+        """
+        time_points = np.asarray(time_points, dtype=dtype)
+        return dtype(self._mass_factor) * np.sin(dtype(self._omega) * time_points)
     
-    def simulate_trajectory(self, duration: float = 10.0, steps: int = 100) -> Tuple[List[float], List[float]]:
+    def simulate_trajectory(self, duration: float = 10.0, steps: int = 100,
+                            method: str = "rk45") -> Tuple[np.ndarray, np.ndarray]:
         """
         Simulate object trajectory over time
-        
+
         Args:
             duration: Simulation duration in seconds
             steps: Number of time steps
-            
+            method: "rk45" for adaptive Runge-Kutta (default),
+                    "euler" for the fixed-step fast path
+
         Returns:
-            (time_points, height_points) - trajectory data
+            (time_points, height_points) - trajectory data as arrays
         """
-        time_points = np.linspace(0, duration, steps)
-        height_points = []
-        current_height = 0.0
-        velocity = 0.0
-        
-        for t in time_points:
-            force = self.calculate_force(t)
-            # Simple physics: F = ma, then integrate for velocity and position
-            acceleration = force / self.mass
-            velocity += acceleration * (duration / steps)
-            current_height += velocity * (duration / steps)
-            height_points.append(current_height)
-            
-        return time_points.tolist(), height_points
-    
+        if method in self._SOLVER_METHODS:
+            return self._solve_ode(duration, steps, self._SOLVER_METHODS[method])
+
+        if HAS_NUMBA:
+            return _integrate(duration, steps, self.mass,
+                              self.field.strength, self.field.frequency,
+                              self.field.stability)
+
+        dt = duration / steps
+        time_points = _time_grid(duration, steps)
+
+        # Whole force curve in one vector expression, then Euler
+        # integration via cumulative sums (no per-step Python loop). One
+        # buffer carries acceleration, then velocity, then height:
+        # every step after the first writes in place.
+        buf = self._omega * time_points
+        np.sin(buf, out=buf)
+        buf *= self._mass_factor / self.mass
+        np.cumsum(buf, out=buf)
+        buf *= dt                    # buf is now velocity
+        np.cumsum(buf, out=buf)
+        buf *= dt                    # buf is now height
+
+        return time_points, buf
+
+    def simulate_trajectory_batch(self, masses, strengths,
+                                  duration: float = 10.0,
+                                  steps: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate one trajectory per (mass, strength) pair in a single pass
+
+        Args:
+            masses: Array of object masses in kilograms
+            strengths: Array of field strengths, same length as masses
+            duration: Simulation duration in seconds
+            steps: Number of time steps
+
+        Returns:
+            (time_points, height_points) where height_points has shape
+            (len(masses), steps), one row per parameter set
+        """
+        masses = np.asarray(masses, dtype=float)
+        strengths = np.asarray(strengths, dtype=float)
+
+        if HAS_NUMBA:
+            return _integrate_batch(masses, strengths, duration, steps,
+                                    self.field.frequency, self.field.stability)
+
+        dt = duration / steps
+        time_points = _time_grid(duration, steps)
+
+        # Broadcast parameter sets against the time grid so every
+        # trajectory is integrated in the same vectorized pass
+        masses = masses[:, None]
+        strengths = strengths[:, None]
+        mass_factor = strengths * self.field.stability / (1 + 0.1 * masses)
+        acceleration = mass_factor * np.sin(self._omega * time_points[None, :]) / masses
+        velocity = np.cumsum(acceleration, axis=1) * dt
+        height_points = np.cumsum(velocity, axis=1) * dt
+
+        return time_points, height_points
+
+    # Maps the public method names to scipy solver names; everything here
+    # goes through _solve_ode
+    _SOLVER_METHODS = {"rk45": "RK45", "lsoda": "LSODA",
+                       "bdf": "BDF", "radau": "Radau"}
+
+    # Solvers that can use the Jacobian of the right-hand side
+    _IMPLICIT_SOLVERS = {"LSODA", "BDF", "Radau"}
+
+    def _solve_ode(self, duration: float, steps: int,
+                   solver: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Integrate the levitation ODE with a scipy solver"""
+        # Single solver call: one Python->C crossing per solver step
+        # instead of one per Euler step, and adaptive stepping picks the
+        # accuracy/work trade-off for us.
+        if HAS_NUMBA:
+            # Evaluate the RHS body in compiled code; only the thin
+            # callback shim stays in Python
+            mass_factor, omega, mass = self._mass_factor, self._omega, self.mass
+
+            def rhs(t, y):
+                return _rhs_kernel(t, y, mass_factor, omega, mass)
+
+            vectorized = False
+        else:
+            def rhs(t, y):
+                return np.vstack([y[1],
+                                  self._mass_factor * np.sin(self._omega * t) / self.mass])
+
+            vectorized = True
+
+        kwargs = {}
+        if solver in self._IMPLICIT_SOLVERS:
+            # For y = [height, velocity] the Jacobian of the RHS is the
+            # constant [[0, 1], [0, 0]]; handing it over saves the solver
+            # its finite-difference estimation
+            kwargs["jac"] = lambda t, y: np.array([[0.0, 1.0], [0.0, 0.0]])
+
+        sol = solve_ivp(rhs, (0, duration), [0.0, 0.0],
+                        t_eval=_time_grid(duration, steps),
+                        method=solver, vectorized=vectorized, rtol=1e-6, **kwargs)
+        return sol.t, sol.y[0]
+
     def optimize_field(self, target_height: float = 10.0) -> AntiGravityField:
         """
         Optimize field parameters to reach target height
-        
+
+        Solves for the strength and frequency whose simulated peak height
+        is closest to the target, rather than guessing from a scaling rule.
+        If the target is out of reach the solver lands on the bound that
+        gets closest (typically full strength).
+
         Args:
             target_height: Desired levitation height in meters
-            
+
         Returns:
             Optimized field configuration
         """
-        # Simple optimization: increase strength for higher target
-        optimized_strength = min(1.0, self.field.strength * (1 + target_height * 0.05))
-        
-        optimized_field = AntiGravityField(
-            strength=optimized_strength,
-            frequency=self.field.frequency,
-            radius=self.field.radius,
-            stability=max(0.8, self.field.stability)
+        stability = max(0.8, self.field.stability)
+
+        def residual(params):
+            strength, frequency = params
+            trial = AntiGravitySimulator(mass=self.mass)
+            trial.field = replace(self.field, strength=strength,
+                                  frequency=frequency, stability=stability)
+            # A fine grid so high frequencies don't alias to a flat
+            # residual and stall the solver at the starting point
+            _, height_points = trial.simulate_trajectory(steps=2000, method="euler")
+            return [height_points.max() - target_height]
+
+        result = least_squares(
+            residual,
+            x0=[self.field.strength, self.field.frequency],
+            bounds=([0.0, 0.1], [1.0, 100.0]),
+            diff_step=1e-3
         )
-        
-        return optimized_field
+        strength, frequency = result.x
+
+        return replace(self.field, strength=strength,
+                       frequency=frequency, stability=stability)
+
+def _simulate_one(mass: float, duration: float, steps: int) -> np.ndarray:
+    """Worker for sweep_trajectories; runs in a child process"""
+    simulator = AntiGravitySimulator(mass=mass)
+    _, height_points = simulator.simulate_trajectory(duration, steps)
+    return height_points
+
+def sweep_trajectories(masses, duration: float = 10.0, steps: int = 100,
+                       processes: int = None) -> list:
+    """
+    Simulate one trajectory per mass across a process pool
+
+    Each worker process integrates independently, so sweeps scale with
+    core count. Keep plotting of the results in the parent process.
+
+    Args:
+        masses: Iterable of object masses in kilograms
+        duration: Simulation duration in seconds
+        steps: Number of time steps
+        processes: Pool size (defaults to the CPU count)
+
+    Returns:
+        List of height arrays, one per mass, in input order
+    """
+    worker = partial(_simulate_one, duration=duration, steps=steps)
+    # Spawn fresh interpreters: forking after the Numba/BLAS thread pools
+    # have started deadlocks the child processes
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes) as pool:
+        return pool.map(worker, masses)
@@ -4,7 +4,7 @@ Tests for the Anti-Gravity Simulator
 
 import pytest
 import numpy as np
-from src.simulator import AntiGravitySimulator, AntiGravityField
+from src.simulator import AntiGravitySimulator, AntiGravityField, sweep_trajectories
 
 def test_field_initialization():
     """Test that field initializes with correct defaults"""
@@ -41,6 +41,16 @@ def test_force_calculation():
     force2 = simulator.calculate_force(time=0.1)
     assert force1 != force2
 
+def test_force_matches_analytic_expression():
+    """Test that the force kernel matches the physics equation exactly"""
+    simulator = AntiGravitySimulator(mass=2.0)
+    field = simulator.field
+
+    t = 0.37
+    expected = (field.strength * np.sin(2 * np.pi * field.frequency * t) *
+                field.stability / (1 + 0.1 * simulator.mass))
+    assert simulator.calculate_force(time=t) == pytest.approx(expected, rel=1e-12)
+
 def test_trajectory_simulation():
     """Test trajectory simulation"""
     simulator = AntiGravitySimulator(mass=5.0)
@@ -51,6 +61,16 @@ def test_trajectory_simulation():
     assert times[0] == 0.0
     assert times[-1] == 2.0
 
+def test_batch_trajectory_simulation():
+    """Test batched simulation matches the single-trajectory integrator"""
+    simulator = AntiGravitySimulator(mass=5.0)
+    times, heights = simulator.simulate_trajectory_batch(
+        masses=[1.0, 5.0], strengths=[0.8, 0.8], duration=2.0, steps=10)
+
+    assert heights.shape == (2, 10)
+    _, single = simulator.simulate_trajectory(duration=2.0, steps=10, method="euler")
+    assert heights[1] == pytest.approx(single, rel=1e-6)
+
 def test_optimization():
     """Test field optimization"""
     simulator = AntiGravitySimulator(mass=1.0)
@@ -61,5 +81,14 @@ def test_optimization():
     # Should not exceed 1.0
     assert optimized.strength <= 1.0
 
+def test_sweep_trajectories():
+    """Test the multiprocess sweep returns one trajectory per mass"""
+    results = sweep_trajectories([1.0, 5.0], duration=2.0, steps=10, processes=2)
+
+    assert len(results) == 2
+    simulator = AntiGravitySimulator(mass=5.0)
+    _, expected = simulator.simulate_trajectory(duration=2.0, steps=10)
+    assert results[1] == pytest.approx(expected)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])